@@ -29,6 +29,7 @@ from __future__ import annotations
 
 import logging
 import sys
+from contextlib import ExitStack
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -133,9 +134,26 @@ def print_version(
     "--output",
     required=True,
     type=str,
-    callback=lambda _, __, value: (value if value.endswith(".nc") else f"{value}.nc"),
     help="Output file name",
 )
+@option(
+    "--format",
+    "output_format",
+    type=cloup.Choice(["nc", "zarr"]),
+    default="nc",
+    show_default=True,
+    help="Format of the output file (zarr requires the zarr package)",
+)
+@option(
+    "--chunk-size",
+    type=cloup.IntRange(min=1),
+    help="Number of grid cells per spatial dimension to adjust at once (requires dask)",
+)
+@option(
+    "--processes",
+    type=cloup.IntRange(min=1),
+    help="Number of worker processes to adjust the chunks with (requires dask.distributed and --chunk-size)",
+)
 @option_group(
     "Scaling-Based Adjustment Options",
     option(
@@ -174,6 +192,15 @@ def cli(**kwargs) -> None:
         level=logging.INFO,
     )
 
+    chunk_size: int | None = kwargs.pop("chunk_size")
+    output_format: str = kwargs.pop("output_format")
+    processes: int | None = kwargs.pop("processes")
+    if processes is not None and chunk_size is None:
+        logging.error("--processes can only be used together with --chunk-size")
+        sys.exit(1)
+    if not kwargs["output"].endswith(f".{output_format}"):
+        kwargs["output"] = f"{kwargs['output']}.{output_format}"
+
     logging.info("Loading data sets ...")
     try:
         for key, message in zip(
@@ -193,6 +220,12 @@ def cli(**kwargs) -> None:
                     f"Variable '{kwargs['variable']}' is missing in the {message}",
                 )
             kwargs[key] = kwargs[key][kwargs["variable"]]
+            if chunk_size is not None:
+                # The data is read and adjusted tile by tile, the time
+                # series of the grid cells must not be split.
+                kwargs[key] = kwargs[key].chunk(
+                    {dim: -1 if dim == "time" else chunk_size for dim in kwargs[key].dims},  # noqa: PLR2004
+                )
     except (TypeError, KeyError) as exc:
         logging.error(exc)
         sys.exit(1)
@@ -201,8 +234,27 @@ def cli(**kwargs) -> None:
     kwargs["n_quantiles"] = kwargs["quantiles"]
     del kwargs["quantiles"]
 
-    logging.info("Applying %s ..." % kwargs["method"])
-    result = adjust(**kwargs)
+    with ExitStack() as stack:
+        if processes is not None:
+            # The chunks are distributed to separate processes, since the
+            # quantile-based techniques hold the GIL while looping over the
+            # grid cells of a chunk.
+            from dask.distributed import LocalCluster  # noqa: PLC0415
+
+            cluster = stack.enter_context(
+                LocalCluster(n_workers=processes, threads_per_worker=1),
+            )
+            stack.enter_context(cluster.get_client())
+
+        logging.info("Applying %s ..." % kwargs["method"])
+        result = adjust(**kwargs)
 
-    logging.info("Saving result to %s ..." % kwargs["output"])
-    result.to_netcdf(kwargs["output"])
+        logging.info("Saving result to %s ..." % kwargs["output"])
+        if output_format == "zarr":  # noqa: PLR2004
+            if result.chunks:
+                # Zarr requires regular chunks, but the groups of a grouped
+                # adjustment are of different sizes along the time dimension.
+                result = result.chunk({"time": -1})
+            result.to_zarr(kwargs["output"], mode="w")
+        else:
+            result.to_netcdf(kwargs["output"])
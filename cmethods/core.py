@@ -11,8 +11,9 @@ correction techniques.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List
 
+import numpy as np
 import xarray as xr
 
 from cmethods.distribution import quantile_delta_mapping as __quantile_delta_mapping
@@ -64,6 +65,8 @@ def apply_ufunc(
     else:
         input_core_dims = {"obs": "time", "simh": "time", "simp": "time"}
 
+    dtype = kwargs.pop("dtype", None)
+
     result: XRData = xr.apply_ufunc(
         __METHODS_FUNC__[method],
         obs,
@@ -72,9 +75,10 @@ def apply_ufunc(
         # different than 'time' coord on training dataset.
         simp.rename({input_core_dims["simp"]: "__t_simp__"}),
         dask="parallelized",
-        vectorize=True,
-        # This will vectorize over the time dimension, so will submit each grid
-        # cell independently
+        # All techniques adjust the grid cells along the last axis at once, so
+        # there is no need to vectorize (and validate) each grid cell
+        # independently.
+        vectorize=False,
         input_core_dims=[
             [input_core_dims["obs"]],
             [input_core_dims["simh"]],
@@ -83,15 +87,29 @@ def apply_ufunc(
         # Need to denote that the final output dataset will be labeled with the
         # spoofed time coordinate
         output_core_dims=[["__t_simp__"]],
+        # The scaling-based techniques keep the precision of their input, so
+        # the data type of their result can be declared upfront.
+        output_dtypes=[dtype] if dtype is not None and method in SCALING_METHODS else None,
         kwargs=dict(kwargs),
     )
 
     # Rename to proper coordinate name.
     result = result.rename({"__t_simp__": input_core_dims["simp"]})
 
+    if dtype is not None:
+        # The distribution-based techniques compute in float64 (e.g.
+        # ``np.interp`` always returns float64), so their output is casted
+        # here instead of declaring it via ``output_dtypes``.
+        result = result.astype(dtype, copy=False)
+
     # ufunc will put the core dimension to the end (time), so want to preserve
-    # original order where time is commonly first.
-    return result.transpose(*obs.rename({input_core_dims["obs"]: input_core_dims["simp"]}).dims)
+    # original order where time is commonly first - unless it already is.
+    target_dims = obs.rename({input_core_dims["obs"]: input_core_dims["simp"]}).dims
+    if isinstance(result, xr.DataArray) and result.dims == tuple(target_dims):
+        # Data sets don't expose an ordered dimension tuple, so only data arrays
+        # can be checked reliably.
+        return result
+    return result.transpose(*target_dims)
 
 
 def adjust(
@@ -124,6 +142,11 @@ def adjust(
     :type simh: XRData
     :param simp: The modeled data of the period to adjust
     :type simp: XRData
+    :param dtype: Data type to cast ``obs``, ``simh``, ``simp`` and the
+        result to, e.g. ``"float32"`` to halve the memory footprint of large
+        data sets at the cost of precision, defaults to ``None`` (preserve
+        the data type of the input)
+    :type dtype: str | np.dtype, optional
     :param kwargs: Any other method-specific parameter (like
         ``n_quantiles`` and ``kind``)
     :type kwargs: dict
@@ -133,6 +156,9 @@ def adjust(
     kwargs["adjust_called"] = True
     check_xr_types(obs=obs, simh=simh, simp=simp)
 
+    if kwargs.get("dtype") is not None:
+        obs, simh, simp = (data.astype(kwargs["dtype"], copy=False) for data in (obs, simh, simp))
+
     if method == "detrended_quantile_mapping":  # noqa: PLR2004
         raise ValueError(
             "This function is not available for detrended quantile mapping."
@@ -172,23 +198,46 @@ def adjust(
 
     del kwargs["group"]
 
-    result: Optional[XRData] = None
-    for (_, obs_gds), (_, simh_gds), (_, simp_gds) in zip(
-        obs.groupby(obs_group),
-        simh.groupby(simh_group),
-        simp.groupby(simp_group),
-    ):
-        monthly_result = apply_ufunc(
-            method,
-            obs_gds,
-            simh_gds,
-            simp_gds,
-            **kwargs,
+    # Data sets that are not backed by dask are loaded by ``apply_ufunc``
+    # anyway, so they are loaded once here - otherwise lazily opened files
+    # would be read again for each group.
+    obs, simh, simp = (data if data.chunks else data.compute() for data in (obs, simh, simp))
+
+    # The group labels of each data set are derived only once and are used to
+    # select the data of each group via plain indexing - this avoids building
+    # three separate ``groupby`` objects.
+    dims: List[str] = []
+    indices: List[List[np.ndarray]] = []
+    for data, data_group in ((obs, obs_group), (simh, simh_group), (simp, simp_group)):
+        labels = data[data_group]
+        _, inverse, counts = np.unique(labels.values, return_inverse=True, return_counts=True)
+        dims.append(labels.dims[0])
+        # sorting the positions by group once avoids scanning all labels per group
+        indices.append(np.split(np.argsort(inverse, kind="stable"), np.cumsum(counts)[:-1]))
+
+    # A single group equals the whole data set, so there is no need to split
+    # and merge the data sets - e.g. for "time.month" on less than a month.
+    if all(len(data_indices) == 1 for data_indices in indices):
+        result = apply_ufunc(method, obs, simh, simp, **kwargs)
+        return result.to_dataset() if isinstance(result, xr.DataArray) else result
+
+    results: List[XRData] = []
+    for obs_idx, simh_idx, simp_idx in zip(*indices):
+        results.append(
+            apply_ufunc(
+                method,
+                obs.isel({dims[0]: obs_idx}),
+                simh.isel({dims[1]: simh_idx}),
+                simp.isel({dims[2]: simp_idx}),
+                **kwargs,
+            ),
         )
 
-        result = monthly_result if result is None else xr.merge([result, monthly_result])
-
-    return result
+    # Concatenating all groups at once and restoring the original order of
+    # ``simp`` is much cheaper than merging (and aligning) them one by one.
+    order = np.argsort(np.concatenate([simp_idx for *_, simp_idx in zip(*indices)]))
+    result = xr.concat(results, dim=dims[2]).isel({dims[2]: order})
+    return result.to_dataset() if isinstance(result, xr.DataArray) else result
 
 
 __all__ = ["adjust"]
@@ -10,13 +10,14 @@ intended to used directly - but as part of the adjustment procedure triggered by
 :func:``cmethods.adjust``.
 """
 
-from typing import Any, Final
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, Optional
 
 import numpy as np
 import xarray as xr
 
 from cmethods.static import ADDITIVE, MAX_SCALING_FACTOR, MULTIPLICATIVE
-from cmethods.types import NPData
 from cmethods.utils import (
     check_adjust_called,
     check_np_types,
@@ -26,6 +27,68 @@ from cmethods.utils import (
     nan_or_equal,
 )
 
+if TYPE_CHECKING:
+    from cmethods.types import NPData
+
+
+def _as_rows(
+    obs: NPData,
+    simh: NPData,
+    simp: NPData,
+) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray], tuple[int, ...]]:
+    """
+    Returns the passed data sets as two-dimensional arrays with one row per grid
+    cell and the time series along the last axis - together with the shape of
+    the adjusted result.
+    """
+    arrays = [np.asarray(obs), np.asarray(simh), np.asarray(simp)]
+    shape = np.broadcast_shapes(*(array.shape[:-1] for array in arrays))
+    return (
+        tuple(np.broadcast_to(array, (*shape, array.shape[-1])).reshape(-1, array.shape[-1]) for array in arrays),
+        (*shape, arrays[-1].shape[-1]),
+    )
+
+
+def _nanmax_of(obs: np.ndarray, simh: np.ndarray) -> np.ndarray:
+    """Row-wise ``max(np.nanmax(obs), np.nanmax(simh))``"""
+    obs_max, simh_max = np.nanmax(obs, axis=-1), np.nanmax(simh, axis=-1)
+    return np.where(simh_max > obs_max, simh_max, obs_max)
+
+
+def _nanmin_of(obs: np.ndarray, simh: np.ndarray) -> np.ndarray:
+    """Row-wise ``min(np.nanmin(obs), np.nanmin(simh))``"""
+    obs_min, simh_min = np.nanmin(obs, axis=-1), np.nanmin(simh, axis=-1)
+    return np.where(simh_min < obs_min, simh_min, obs_min)
+
+
+def _interp_uniform(
+    x: np.ndarray,
+    xbins: np.ndarray,
+    fp: np.ndarray,
+    left: Optional[float] = None,
+    right: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Equivalent of ``np.interp(x, xbins, fp, left, right)`` for evenly spaced
+    ``xbins`` as created by ``np.arange``. The bin of each value is computed
+    directly instead of searching for it.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    last = len(xbins) - 2
+    # NaN is mapped into the first bin by ``np.fmax`` and stays NaN below.
+    idx = np.minimum(np.fmax((x - xbins[0]) / (xbins[1] - xbins[0]), 0), last).astype(np.intp)
+    # The division may be off by one bin due to rounding.
+    idx -= xbins[idx] > x
+    idx += xbins[idx + 1] <= x
+    np.clip(idx, 0, last, out=idx)
+
+    result = (np.diff(fp) / np.diff(xbins))[idx] * (x - xbins[idx]) + fp[idx]
+    result[x >= xbins[-1]] = fp[-1]
+    if right is not None:
+        result[x > xbins[-1]] = right
+    result[x < xbins[0]] = fp[0] if left is None else left
+    return result
+
 
 # ? -----========= Q U A N T I L E - M A P P I N G =========------
 def quantile_mapping(
@@ -49,37 +112,39 @@ def quantile_mapping(
     if not isinstance(n_quantiles, int):
         raise TypeError("'n_quantiles' must be type int")
 
-    obs, simh, simp = np.array(obs), np.array(simh), np.array(simp)
+    if kind in ADDITIVE:
+        left, right = None, None
+    elif kind in MULTIPLICATIVE:
+        left, right = kwargs.get("val_min", 0.0), kwargs.get("val_max")
+    else:
+        raise NotImplementedError(
+            f"{kind=} for quantile_mapping is not available. Use '+' or '*' instead.",
+        )
 
-    global_max = max(np.nanmax(obs), np.nanmax(simh))
-    global_min = min(np.nanmin(obs), np.nanmin(simh))
+    # The time series of all grid cells are adjusted within one call using a
+    # two-dimensional buffer of shape (cells, time), so that multidimensional
+    # inputs don't need to be dispatched cell by cell.
+    (obs, simh, simp), shape = _as_rows(obs, simh, simp)
+    result = simp.astype(np.float64)
 
-    if nan_or_equal(value1=global_max, value2=global_min):
-        return simp
+    # The boundaries of the bins are determined for all grid cells at once -
+    # unless they are passed like for quantile delta mapping.
+    global_max = kwargs.get("global_max")
+    global_max = np.broadcast_to(_nanmax_of(obs, simh) if global_max is None else global_max, len(simp))
+    global_min = kwargs.get("global_min")
+    global_min = np.broadcast_to(_nanmin_of(obs, simh) if global_min is None else global_min, len(simp))
+    wide = np.abs(global_max - global_min) / n_quantiles
 
-    wide = abs(global_max - global_min) / n_quantiles
-    xbins = np.arange(global_min, global_max + wide, wide)
+    for cell in np.flatnonzero(~nan_or_equal(value1=global_max, value2=global_min)):
+        xbins = np.arange(global_min[cell], global_max[cell] + wide[cell], wide[cell])
 
-    cdf_obs = get_cdf(obs, xbins)
-    cdf_simh = get_cdf(simh, xbins)
+        cdf_obs = get_cdf(obs[cell], xbins)
+        cdf_simh = get_cdf(simh[cell], xbins)
 
-    if kind in ADDITIVE:
-        epsilon = np.interp(simp, xbins, cdf_simh)  # Eq. 1
-        return get_inverse_of_cdf(cdf_obs, epsilon, xbins)  # Eq. 1
-
-    if kind in MULTIPLICATIVE:
-        epsilon = np.interp(  # Eq. 2
-            simp,
-            xbins,
-            cdf_simh,
-            left=kwargs.get("val_min", 0.0),
-            right=kwargs.get("val_max"),
-        )
-        return get_inverse_of_cdf(cdf_obs, epsilon, xbins)  # Eq. 2
+        epsilon = _interp_uniform(simp[cell], xbins, cdf_simh, left=left, right=right)  # Eq. 1, 2
+        result[cell] = get_inverse_of_cdf(cdf_obs, epsilon, xbins)  # Eq. 1, 2
 
-    raise NotImplementedError(
-        f"{kind=} for quantile_mapping is not available. Use '+' or '*' instead.",
-    )
+    return result.reshape(shape)
 
 
 # ? -----========= D E T R E N D E D - Q U A N T I L E - M A P P I N G =========------
@@ -113,8 +178,8 @@ def detrended_quantile_mapping(
 
     obs, simh = np.array(obs), np.array(simh)
 
-    global_max = max(np.nanmax(obs), np.nanmax(simh))
-    global_min = min(np.nanmin(obs), np.nanmin(simh))
+    global_max = _nanmax_of(obs, simh)
+    global_min = _nanmin_of(obs, simh)
 
     if nan_or_equal(value1=global_max, value2=global_min):
         return np.array(simp.values)
@@ -131,24 +196,20 @@ def detrended_quantile_mapping(
         "max_scaling_factor",
         MAX_SCALING_FACTOR,
     )
+    simp_values = np.asarray(simp.values)
     for indices in simp.groupby("time.month").groups.values():
         # detrended by long-term month
-        m_simh, m_simp = [], []
-        for index in indices:
-            m_simh.append(simh[index])
-            m_simp.append(simp[index])
-
-        m_simh = np.array(m_simh)
-        m_simp = np.array(m_simp)
+        m_simh = simh[indices]
+        m_simp = simp_values[indices]
         m_simh_mean = np.nanmean(m_simh)
         m_simp_mean = np.nanmean(m_simp)
 
         if kind in ADDITIVE:
-            epsilon = np.interp(m_simp - m_simp_mean, xbins, cdf_simh)  # Eq. 1
+            epsilon = _interp_uniform(m_simp - m_simp_mean, xbins, cdf_simh)  # Eq. 1
             X = get_inverse_of_cdf(cdf_obs, epsilon, xbins) + m_simp_mean  # Eq. 1
 
         else:  # kind in cls.MULTIPLICATIVE:
-            epsilon = np.interp(  # Eq. 2
+            epsilon = _interp_uniform(  # Eq. 2
                 ensure_dividable(
                     (m_simh_mean * m_simp),
                     m_simp_mean,
@@ -159,13 +220,12 @@ def detrended_quantile_mapping(
                 left=kwargs.get("val_min", 0.0),
                 right=kwargs.get("val_max"),
             )
-            X = np.interp(epsilon, cdf_obs, xbins) * ensure_dividable(
+            X = get_inverse_of_cdf(cdf_obs, epsilon, xbins) * ensure_dividable(
                 m_simp_mean,
                 m_simh_mean,
                 max_scaling_factor=max_scaling_factor,
             )  # Eq. 2
-        for i, index in enumerate(indices):
-            res[index] = X[i]
+        res[indices] = X
     return res
 
 
@@ -197,7 +257,7 @@ def quantile_delta_mapping(
     n_quantiles: int,
     kind: str = "+",
     **kwargs: Any,
-) -> NPData:
+) -> np.ndarray:
     r"""
     **Do not call this function directly, please use :func:`cmethods.adjust`**
 
@@ -212,60 +272,51 @@ def quantile_delta_mapping(
     if not isinstance(n_quantiles, int):
         raise TypeError("'n_quantiles' must be type int")
 
-    if kind in ADDITIVE:
-        obs, simh, simp = (
-            np.array(obs),
-            np.array(simh),
-            np.array(simp),
-        )  # to achieve higher accuracy
-        global_max = kwargs.get("global_max", max(np.nanmax(obs), np.nanmax(simh)))
-        global_min = kwargs.get("global_min", min(np.nanmin(obs), np.nanmin(simh)))
+    if kind not in ADDITIVE and kind not in MULTIPLICATIVE:
+        raise NotImplementedError(
+            f"{kind=} not available for quantile_delta_mapping. Use '+' or '*' instead.",
+        )
+
+    (obs, simh, simp), shape = _as_rows(obs, simh, simp)
+    result = simp.astype(np.float64)  # to achieve higher accuracy
 
-        if nan_or_equal(value1=global_max, value2=global_min):
-            return simp
+    # The boundaries of the bins are determined for all grid cells at once.
+    global_max = kwargs.get("global_max")
+    global_max = np.broadcast_to(_nanmax_of(obs, simh) if global_max is None else global_max, len(simp))
+    if kind in ADDITIVE:
+        global_min = kwargs.get("global_min")
+        global_min = np.broadcast_to(_nanmin_of(obs, simh) if global_min is None else global_min, len(simp))
+        wide = np.abs(global_max - global_min) / n_quantiles
+    else:
+        global_min = np.broadcast_to(kwargs.get("global_min", 0.0), len(simp))
+        wide = global_max / n_quantiles
 
-        wide = abs(global_max - global_min) / n_quantiles
-        xbins = np.arange(global_min, global_max + wide, wide)
+    for cell in np.flatnonzero(~nan_or_equal(value1=global_max, value2=global_min)):
+        xbins = np.arange(global_min[cell], global_max[cell] + wide[cell], wide[cell])
 
-        cdf_obs = get_cdf(obs, xbins)
-        cdf_simh = get_cdf(simh, xbins)
-        cdf_simp = get_cdf(simp, xbins)
+        cdf_obs = get_cdf(obs[cell], xbins)
+        cdf_simh = get_cdf(simh[cell], xbins)
+        cdf_simp = get_cdf(simp[cell], xbins)
 
         # calculate exact CDF values of $F_{sim,p}[T_{sim,p}(t)]$
-        epsilon = np.interp(simp, xbins, cdf_simp)  # Eq. 1.1
+        epsilon = _interp_uniform(simp[cell], xbins, cdf_simp)  # Eq. 1.1
         QDM1 = get_inverse_of_cdf(cdf_obs, epsilon, xbins)  # Eq. 1.2
-        delta = simp - get_inverse_of_cdf(cdf_simh, epsilon, xbins)  # Eq. 1.3
-        return QDM1 + delta  # Eq. 1.4
-
-    if kind in MULTIPLICATIVE:
-        obs, simh, simp = np.array(obs), np.array(simh), np.array(simp)
-        global_max = kwargs.get("global_max", max(np.nanmax(obs), np.nanmax(simh)))
-        global_min = kwargs.get("global_min", 0.0)
-        if nan_or_equal(value1=global_max, value2=global_min):
-            return simp
-
-        wide = global_max / n_quantiles
-        xbins = np.arange(global_min, global_max + wide, wide)
-
-        cdf_obs = get_cdf(obs, xbins)
-        cdf_simh = get_cdf(simh, xbins)
-        cdf_simp = get_cdf(simp, xbins)
 
-        epsilon = np.interp(simp, xbins, cdf_simp)  # Eq. 1.1
-        QDM1 = get_inverse_of_cdf(cdf_obs, epsilon, xbins)  # Eq. 1.2
+        if kind in ADDITIVE:
+            delta = simp[cell] - get_inverse_of_cdf(cdf_simh, epsilon, xbins)  # Eq. 1.3
+            result[cell] = QDM1 + delta  # Eq. 1.4
+        else:
+            delta = ensure_dividable(  # Eq. 2.3
+                simp[cell],
+                get_inverse_of_cdf(cdf_simh, epsilon, xbins),
+                max_scaling_factor=kwargs.get(
+                    "max_scaling_scaling",
+                    MAX_SCALING_FACTOR,
+                ),
+            )
+            result[cell] = QDM1 * delta  # Eq. 2.4
 
-        delta = ensure_dividable(  # Eq. 2.3
-            simp,
-            get_inverse_of_cdf(cdf_simh, epsilon, xbins),
-            max_scaling_factor=kwargs.get(
-                "max_scaling_scaling",
-                MAX_SCALING_FACTOR,
-            ),
-        )
-        return QDM1 * delta  # Eq. 2.4
-    raise NotImplementedError(
-        f"{kind=} not available for quantile_delta_mapping. Use '+' or '*' instead.",
-    )
+    return result.reshape(shape)
 
 
 __all__ = ["detrended_quantile_mapping"]
@@ -8,6 +8,9 @@
 Module providing functions for scaling-based bias adjustments. Functions are not
 intended to used directly - but as part of the adjustment procedure triggered by
 :func:``cmethods.adjust``.
+
+All functions operate along the last axis, so that multiple grid cells can be
+adjusted at once.
 """
 
 from __future__ import annotations
@@ -46,23 +49,24 @@ def linear_scaling(
         adjust_called=kwargs.get("adjust_called"),
     )
     check_np_types(obs=obs, simh=simh, simp=simp)
+    obs, simh, simp = np.asarray(obs), np.asarray(simh), np.asarray(simp)
 
     if kind in ADDITIVE:
-        return np.array(simp) + (np.nanmean(obs) - np.nanmean(simh))  # Eq. 1
+        return simp + (np.nanmean(obs, axis=-1, keepdims=True) - np.nanmean(simh, axis=-1, keepdims=True))  # Eq. 1
     if kind in MULTIPLICATIVE:
         max_scaling_factor: Final[float] = kwargs.get(
             "max_scaling_factor",
             MAX_SCALING_FACTOR,
         )
-        adj_scaling_factor: Final[float] = get_adjusted_scaling_factor(
+        adj_scaling_factor: Final[np.ndarray] = get_adjusted_scaling_factor(
             ensure_dividable(
-                np.nanmean(obs),
-                np.nanmean(simh),
+                np.nanmean(obs, axis=-1, keepdims=True),
+                np.nanmean(simh, axis=-1, keepdims=True),
                 max_scaling_factor,
             ),
             max_scaling_factor,
         )
-        return np.array(simp) * adj_scaling_factor  # Eq. 2
+        return simp * adj_scaling_factor  # Eq. 2
     raise NotImplementedError(
         f"{kind=} not available for linear_scaling. Use '+' or '*' instead.",
     )
@@ -88,28 +92,31 @@ def variance_scaling(
         adjust_called=kwargs.get("adjust_called"),
     )
     check_np_types(obs=obs, simh=simp, simp=simp)
+    obs, simh, simp = np.asarray(obs), np.asarray(simh), np.asarray(simp)
 
     if kind in ADDITIVE:
-        LS_simh = linear_scaling(obs, simh, simh, kind="+", **kwargs)  # Eq. 1
-        LS_simp = linear_scaling(obs, simh, simp, kind="+", **kwargs)  # Eq. 2
+        obs_mean = np.nanmean(obs, axis=-1, keepdims=True)
+        simh_mean = np.nanmean(simh, axis=-1, keepdims=True)
+        simp_mean = np.nanmean(simp, axis=-1, keepdims=True)
 
-        VS_1_simh = LS_simh - np.nanmean(LS_simh)  # Eq. 3
-        VS_1_simp = LS_simp - np.nanmean(LS_simp)  # Eq. 4
+        # Eq. 1 - 4: The linear scaling only shifts simh and simp, so
+        # subtracting the mean of the shifted series equals subtracting the
+        # mean of the original ones - which also keeps the standard deviation.
         max_scaling_factor: Final[float] = kwargs.get(
             "max_scaling_factor",
             MAX_SCALING_FACTOR,
         )
-        adj_scaling_factor: Final[float] = get_adjusted_scaling_factor(
+        adj_scaling_factor: Final[np.ndarray] = get_adjusted_scaling_factor(
             ensure_dividable(
-                np.std(np.array(obs)),
-                np.std(VS_1_simh),
+                np.std(obs, axis=-1, keepdims=True),
+                np.std(simh, axis=-1, keepdims=True),
                 max_scaling_factor,
             ),
             max_scaling_factor,
         )
 
-        VS_2_simp = VS_1_simp * adj_scaling_factor  # Eq. 5
-        return VS_2_simp + np.nanmean(LS_simp)  # Eq. 6
+        # Eq. 5, 6 - the mean of Eq. 2 equals simp_mean + (obs_mean - simh_mean)
+        return (simp - simp_mean) * adj_scaling_factor + (simp_mean + (obs_mean - simh_mean))
 
     raise NotImplementedError(
         f"{kind=} not available for variance_scaling. Use '+' instead.",
@@ -133,9 +140,10 @@ def delta_method(
         adjust_called=kwargs.get("adjust_called"),
     )
     check_np_types(obs=obs, simh=simh, simp=simp)
+    obs, simh, simp = np.asarray(obs), np.asarray(simh), np.asarray(simp)
 
     if kind in ADDITIVE:
-        return np.array(obs) + (np.nanmean(simp) - np.nanmean(simh))  # Eq. 1
+        return obs + (np.nanmean(simp, axis=-1, keepdims=True) - np.nanmean(simh, axis=-1, keepdims=True))  # Eq. 1
     if kind in MULTIPLICATIVE:
         max_scaling_factor: Final[float] = kwargs.get(
             "max_scaling_factor",
@@ -143,13 +151,13 @@ def delta_method(
         )
         adj_scaling_factor = get_adjusted_scaling_factor(
             ensure_dividable(
-                np.nanmean(simp),
-                np.nanmean(simh),
+                np.nanmean(simp, axis=-1, keepdims=True),
+                np.nanmean(simh, axis=-1, keepdims=True),
                 max_scaling_factor,
             ),
             max_scaling_factor,
         )
-        return np.array(obs) * adj_scaling_factor  # Eq. 2
+        return obs * adj_scaling_factor  # Eq. 2
     raise NotImplementedError(
         f"{kind=} not available for delta_method. Use '+' or '*' instead.",
     )
@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import FrozenSet, List
 
 SCALING_METHODS: List[str] = [
     "linear_scaling",
@@ -24,8 +24,8 @@ DISTRIBUTION_METHODS: List[str] = [
 CUSTOM_METHODS: List[str] = SCALING_METHODS + DISTRIBUTION_METHODS
 METHODS: List[str] = CUSTOM_METHODS
 
-ADDITIVE: List[str] = ["+", "add"]
-MULTIPLICATIVE: List[str] = ["*", "mult"]
+ADDITIVE: FrozenSet[str] = frozenset({"+", "add"})
+MULTIPLICATIVE: FrozenSet[str] = frozenset({"*", "mult"})
 MAX_SCALING_FACTOR: int = 10
 
 __all__ = [
@@ -83,18 +83,22 @@ def check_np_types(
         raise TypeError(f"'simp' {phrase}")
 
 
-def nan_or_equal(value1: float, value2: float) -> bool:
+def nan_or_equal(
+    value1: Union[float, np.ndarray],
+    value2: Union[float, np.ndarray],
+) -> Union[bool, np.ndarray]:
     """
-    Returns True if the values are equal or at least one is NaN
+    Returns True if the values are equal or at least one is NaN - element-wise
+    if arrays are passed.
 
-    :param value1: First value to check
-    :type value1: float
-    :param value2: Second value to check
-    :type value2: float
+    :param value1: First value(s) to check
+    :type value1: float | np.ndarray
+    :param value2: Second value(s) to check
+    :type value2: float | np.ndarray
     :return: If any value is NaN or values are equal
-    :rtype: bool
+    :rtype: bool | np.ndarray
     """
-    return np.isnan(value1) or np.isnan(value2) or value1 == value2
+    return np.isnan(value1) | np.isnan(value2) | (value1 == value2)
 
 
 def ensure_dividable(
@@ -118,7 +122,7 @@ def ensure_dividable(
 
     if isinstance(numerator, np.ndarray):
         mask_inf = np.isinf(result)
-        result[mask_inf] = numerator[mask_inf] * max_scaling_factor  # type: ignore[index]
+        result[mask_inf] = np.broadcast_to(numerator, result.shape)[mask_inf] * max_scaling_factor  # type: ignore[index]
 
         mask_nan = np.isnan(result)
         result[mask_nan] = 0  # type: ignore[index]
@@ -130,6 +134,22 @@ def ensure_dividable(
     return result
 
 
+def _get_cumulative_counts(
+    x: Union[list, np.ndarray],
+    xbins: Union[list, np.ndarray],
+) -> np.ndarray:
+    """
+    Returns the number of values of ``x`` that are in ``[xbins[0], xbins[i])``
+    for each ``i`` - the last bin is closed, just like in ``np.histogram``,
+    which does the same internally but with a considerable overhead. NaN
+    values are sorted to the end and thus never counted.
+    """
+    x_sorted = np.sort(x)
+    counts = np.searchsorted(x_sorted, xbins, side="left")
+    counts[-1] = np.searchsorted(x_sorted, xbins[-1], side="right")
+    return counts - counts[0]
+
+
 def get_pdf(
     x: Union[list, np.ndarray],
     xbins: Union[list, np.ndarray],
@@ -156,8 +176,7 @@ def get_pdf(
         >>> print(get_pdf(x=x, xbins=xbins))
         [2, 5, 5]
     """
-    pdf, _ = np.histogram(x, xbins)
-    return pdf
+    return np.diff(_get_cumulative_counts(x, xbins))
 
 
 def get_cdf(
@@ -187,8 +206,7 @@ def get_cdf(
         >>> print(get_cdf(x=x, xbins=xbins))
         [0.0, 0.16666667, 0.58333333, 1.]
     """
-    pdf, _ = np.histogram(x, xbins)
-    cdf = np.insert(np.cumsum(pdf), 0, 0.0)
+    cdf = _get_cumulative_counts(x, xbins)
     return cdf / cdf[-1]
 
 
@@ -215,9 +233,9 @@ def get_inverse_of_cdf(
 
 
 def get_adjusted_scaling_factor(
-    factor: float,
+    factor: Union[float, np.ndarray],
     max_scaling_factor: float,
-) -> float:
+) -> Union[float, np.ndarray]:
     r"""
     Returns:
         - :math:`x` if :math:`-|y| \le x \le |y|`,
@@ -228,13 +246,15 @@ def get_adjusted_scaling_factor(
             - :math:`x` is ``factor``
             - :math:`y` is ``max_scaling_factor``
 
-    :param factor: The value to check for
-    :type factor: int | float
+    :param factor: The value(s) to check for
+    :type factor: int | float | np.ndarray
     :param max_scaling_factor: The maximum/minimum allowed value
     :type max_scaling_factor: int | float
-    :return: The correct value
-    :rtype: float
+    :return: The correct value(s)
+    :rtype: float | np.ndarray
     """
+    if isinstance(factor, np.ndarray):
+        return np.clip(factor, -abs(max_scaling_factor), abs(max_scaling_factor))
     if factor > 0 and factor > abs(max_scaling_factor):
         return abs(max_scaling_factor)
     if factor < 0 and factor < -abs(max_scaling_factor):
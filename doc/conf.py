@@ -10,8 +10,8 @@
 
 """This module is the configuration for the Sphinx documentation building process"""
 
+import filecmp
 import sys
-from os.path import join
 from pathlib import Path
 from shutil import copyfile
 
@@ -23,15 +23,22 @@ author = "Benjamin Thomas Schwertfeger"
 parent_directory = Path("..").resolve()
 sys.path.insert(0, str(parent_directory))
 
-# import links
-rst_epilog = ""
 # Read link all targets from file
-with open("links.rst", encoding="utf-8") as f:
-    rst_epilog += f.read()
+rst_epilog = Path("links.rst").read_text(encoding="utf-8")
+
+
+def _copy_if_changed(src: Path, dst: Path) -> None:
+    """
+    Copies ``src`` to ``dst`` only if the content differs, since touching
+    ``dst`` makes Sphinx read (and nbsphinx process) it again in every
+    incremental build - even if ``src`` was only touched, e.g. by git.
+    """
+    if not dst.exists() or not filecmp.cmp(src, dst, shallow=False):
+        copyfile(src, dst)
 
 
 def setup(app) -> None:  # noqa: ARG001
-    copyfile(join("..", "examples", "examples.ipynb"), "examples.ipynb")
+    _copy_if_changed(Path("..", "examples", "examples.ipynb"), Path("examples.ipynb"))
 
 
 # -- General configuration ---------------------------------------------------
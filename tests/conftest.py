@@ -9,7 +9,6 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
 from typing import Any
 
 import pytest
@@ -22,7 +21,7 @@ from .helper import get_datasets
 FIXTURE_DIR: str = os.path.join(os.path.dirname(__file__), "fixture")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
     """Provide a cli-runner for testing the CLI"""
     return CliRunner()
@@ -30,21 +29,20 @@ def cli_runner() -> CliRunner:
 
 @pytest.fixture(scope="session")
 def dask_cluster() -> Any:
-    # Create a Dask LocalCluster
-    cluster = LocalCluster()
-
-    # Create a Dask Client connected to the LocalCluster
-    client = cluster.get_client()
-
-    # Yield the client, making it available for the tests
-    yield client
+    # Create a Dask LocalCluster - using threads instead of processes avoids
+    # spawning the workers, which takes longer than most of the tests.
+    with LocalCluster(processes=False) as cluster, cluster.get_client() as client:
+        # Yield the client, making it available for the tests - the client and
+        # the cluster are closed once the tests are done.
+        yield client
 
-    # After the tests are done, close the cluster
-    client.close()
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datasets() -> dict:
+    """
+    Provide the fake data sets once per test session - the tests only read
+    them, so there is no need to rebuild the dictionary for every test.
+    """
     obsh_add, obsp_add, simh_add, simp_add = get_datasets(kind="+")
     obsh_mult, obsp_mult, simh_mult, simp_mult = get_datasets(kind="*")
 
@@ -64,36 +62,17 @@ def datasets() -> dict:
     }
 
 
-@lru_cache(maxsize=None)
-@pytest.fixture
-def datasets_from_zarr() -> dict:
+@pytest.fixture(scope="session")
+def datasets_from_zarr(dask_cluster: Any) -> dict:  # noqa: ARG001
+    """
+    Provide the data sets stored as zarr once per test session. They are
+    persisted on the workers of the dask cluster, so that the stores are only
+    read once.
+    """
     return {
-        "+": {
-            "obsh": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "temperature_obsh.zarr"),
-            ).chunk({"time": -1}),
-            "obsp": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "temperature_obsp.zarr"),
-            ).chunk({"time": -1}),
-            "simh": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "temperature_simh.zarr"),
-            ).chunk({"time": -1}),
-            "simp": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "temperature_simp.zarr"),
-            ).chunk({"time": -1}),
-        },
-        "*": {
-            "obsh": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "precipitation_obsh.zarr"),
-            ).chunk({"time": -1}),
-            "obsp": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "precipitation_obsp.zarr"),
-            ).chunk({"time": -1}),
-            "simh": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "precipitation_simh.zarr"),
-            ).chunk({"time": -1}),
-            "simp": xr.open_zarr(
-                os.path.join(FIXTURE_DIR, "precipitation_simp.zarr"),
-            ).chunk({"time": -1}),
-        },
+        kind: {
+            name: xr.open_zarr(os.path.join(FIXTURE_DIR, f"{variable}_{name}.zarr")).chunk({"time": -1}).persist()
+            for name in ("obsh", "obsp", "simh", "simp")
+        }
+        for kind, variable in (("+", "temperature"), ("*", "precipitation"))
     }
@@ -19,6 +19,8 @@ import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import xarray as xr
+
 from cmethods import cli
 
 
@@ -100,3 +102,124 @@ def test_cli_runner_missing_variable(
         "Variable 'proc' is missing in the observation data set",
     ):
         assert phrase in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("method", "exclusive"),
+    [
+        ("linear_scaling", "--group=time.month"),
+        ("quantile_delta_mapping", "--quantiles=100"),
+    ],
+)
+def test_cli_runner_chunked(
+    method: str,
+    exclusive: str,
+    cli_runner: CliRunner,
+) -> None:
+    """
+    Test checking that adjusting the data sets in spatial chunks - within the
+    current or separate processes - leads to the same result.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        outputs = []
+        for i, options in enumerate(([], ["--chunk-size=1"], ["--chunk-size=1", "--processes=2"])):
+            output = os.path.join(tmp_dir, f"{method}_{i}.nc")
+            cmd: list[str] = [
+                f"--obs={os.path.join('examples', 'input_data', 'observations.nc')}",
+                f"--simh={os.path.join('examples', 'input_data', 'control.nc')}",
+                f"--simp={os.path.join('examples', 'input_data', 'scenario.nc')}",
+                f"--method={method}",
+                "--kind=+",
+                "--variable=tas",
+                exclusive,
+                f"--output={output}",
+            ]
+            result = cli_runner.invoke(cli, cmd + options)
+            assert result.exit_code == 0, result.exception
+            outputs.append(output)
+
+        with xr.open_dataset(outputs[0]) as expected:
+            for output in outputs[1:]:
+                with xr.open_dataset(output) as chunked:
+                    xr.testing.assert_allclose(expected, chunked)
+
+
+def test_cli_runner_zarr_output(cli_runner: CliRunner) -> None:
+    """Test checking that the result can be saved as zarr store."""
+    with TemporaryDirectory() as tmp_dir:
+        output = os.path.join(tmp_dir, "linear_scaling")
+        cmd: list[str] = [
+            f"--obs={os.path.join('examples', 'input_data', 'observations.nc')}",
+            f"--simh={os.path.join('examples', 'input_data', 'control.nc')}",
+            f"--simp={os.path.join('examples', 'input_data', 'scenario.nc')}",
+            "--method=linear_scaling",
+            "--kind=+",
+            "--variable=tas",
+            "--group=time.month",
+            "--chunk-size=1",
+            "--format=zarr",
+            f"--output={output}",
+        ]
+        result = cli_runner.invoke(cli, cmd)
+        assert result.exit_code == 0, result.exception
+
+        with xr.open_zarr(f"{output}.zarr") as adjusted:
+            assert adjusted["tas"].notnull().all()
+
+
+def test_cli_runner_processes_without_chunk_size(
+    cli_runner: CliRunner,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test checking the command-line interface for failure due to using
+    --processes without --chunk-size.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        output = f"{os.path.join(tmp_dir, 'linear_scaling.nc')}"
+        cmd: list[str] = [
+            f"--obs={os.path.join('examples', 'input_data', 'observations.nc')}",
+            f"--simh={os.path.join('examples', 'input_data', 'control.nc')}",
+            f"--simp={os.path.join('examples', 'input_data', 'scenario.nc')}",
+            "--method=linear_scaling",
+            "--kind=add",
+            "--variable=tas",
+            "--group=time.month",
+            "--processes=2",
+            f"--output={output}",
+        ]
+        result = cli_runner.invoke(cli, cmd)
+        assert result.exit_code == 1, result.exception
+        assert not Path(output).is_file()
+
+    assert "--processes can only be used together with --chunk-size" in caplog.text  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("--chunk-size", 0), ("--chunk-size", -1), ("--processes", 0), ("--processes", -1)],
+)
+def test_cli_runner_invalid_option_value(cli_runner: CliRunner, option: str, value: int) -> None:
+    """
+    Test checking the command-line interface for failure due to a
+    non-positive chunk size or number of processes.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        output = f"{os.path.join(tmp_dir, 'linear_scaling.nc')}"
+        cmd: list[str] = [
+            f"--obs={os.path.join('examples', 'input_data', 'observations.nc')}",
+            f"--simh={os.path.join('examples', 'input_data', 'control.nc')}",
+            f"--simp={os.path.join('examples', 'input_data', 'scenario.nc')}",
+            "--method=linear_scaling",
+            "--kind=add",
+            "--variable=tas",
+            "--group=time.month",
+            f"{option}={value}",
+            f"--output={output}",
+        ]
+        if option == "--processes":  # noqa: PLR2004
+            cmd.append("--chunk-size=1")
+        result = cli_runner.invoke(cli, cmd)
+        assert result.exit_code == 2, result.exception
+        assert f"Invalid value for '{option}'" in result.output
+        assert not Path(output).is_file()
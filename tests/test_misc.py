@@ -129,3 +129,142 @@ def test_adjust_failing_no_group_for_distribution(datasets: dict) -> None:
             n_quantiles=100,
             group="time.month",
         )
+
+
+def test_adjust_single_group(datasets: dict) -> None:
+    """
+    Grouping that results in a single group must lead to the same result as
+    applying the adjustment without grouping.
+    """
+    obsh = datasets["+"]["obsh"][:31, 0, 0]  # January only
+    simh = datasets["+"]["simh"][:31, 0, 0]
+    simp = datasets["+"]["simp"][:31, 0, 0]
+
+    grouped = adjust(
+        method="linear_scaling",
+        obs=obsh,
+        simh=simh,
+        simp=simp,
+        kind="+",
+        group="time.month",
+    )
+    not_grouped = adjust(
+        method="linear_scaling",
+        obs=obsh,
+        simh=simh,
+        simp=simp,
+        kind="+",
+    )
+    assert np.allclose(grouped["+"], not_grouped["+"])
+
+
+@pytest.mark.parametrize("method", ["linear_scaling", "quantile_mapping", "quantile_delta_mapping"])
+def test_adjust_dtype(datasets: dict, method: str) -> None:
+    """The result must be of the requested data type."""
+    result = adjust(
+        method=method,
+        obs=datasets["+"]["obsh"][:, 0, 0],
+        simh=datasets["+"]["simh"][:, 0, 0],
+        simp=datasets["+"]["simp"][:, 0, 0],
+        kind="+",
+        n_quantiles=100,
+        dtype="float32",
+    )
+    assert result["+"].dtype == np.float32
+
+
+@pytest.mark.parametrize("method", ["linear_scaling", "variance_scaling", "delta_method"])
+def test_adjust_dtype_precision(datasets: dict, method: str) -> None:
+    """Single precision must be sufficient for the scaling-based techniques."""
+    kwargs = {
+        "method": method,
+        "obs": datasets["+"]["obsh"],
+        "simh": datasets["+"]["simh"],
+        "simp": datasets["+"]["simp"],
+        "kind": "+",
+        "group": "time.month",
+    }
+    single = adjust(**kwargs, dtype="float32")
+    double = adjust(**kwargs)
+    assert single["+"].dtype == np.float32
+    assert np.allclose(single["+"], double["+"], rtol=0, atol=1e-4)
+
+
+def test_adjust_grouped_keeps_order(datasets: dict) -> None:
+    """
+    The grouped adjustment must return the time steps in the original order
+    of ``simp`` and each group must be adjusted independently.
+    """
+    obsh = datasets["+"]["obsh"][:, 0, 0]
+    simh = datasets["+"]["simh"][:, 0, 0]
+    simp = datasets["+"]["simp"][:, 0, 0]
+
+    result = adjust(
+        method="linear_scaling",
+        obs=obsh,
+        simh=simh,
+        simp=simp,
+        kind="+",
+        group="time.month",
+    )
+    assert result.time.equals(simp.time)
+
+    january = adjust(
+        method="linear_scaling",
+        obs=obsh[obsh.time.dt.month == 1],
+        simh=simh[simh.time.dt.month == 1],
+        simp=simp[simp.time.dt.month == 1],
+        kind="+",
+    )
+    assert np.allclose(result["+"][simp.time.dt.month == 1], january["+"])
+
+
+@pytest.mark.parametrize("kind", ["+", "*"])
+def test_quantile_mapping_global_bounds(datasets: dict, kind: str) -> None:
+    """
+    The passed bounds must be used instead of the bounds of the data, so
+    passing the bounds of the data must not change the result while wider
+    bounds must.
+    """
+    obsh = datasets[kind]["obsh"][:, 0, 0]
+    simh = datasets[kind]["simh"][:, 0, 0]
+    simp = datasets[kind]["simp"][:, 0, 0]
+    kwargs = {"obs": obsh, "simh": simh, "simp": simp, "kind": kind, "n_quantiles": 100}
+
+    global_max = max(float(obsh.max()), float(simh.max()))
+    global_min = min(float(obsh.min()), float(simh.min()))
+    default = adjust(method="quantile_mapping", **kwargs)[kind]
+
+    assert np.array_equal(
+        default,
+        adjust(method="quantile_mapping", global_max=global_max, global_min=global_min, **kwargs)[kind],
+    )
+
+    wider = adjust(
+        method="quantile_mapping",
+        global_max=global_max + (global_max - global_min),
+        global_min=global_min / 2 if kind == "*" else global_min - (global_max - global_min),  # noqa: PLR2004
+        **kwargs,
+    )[kind]
+    assert np.isfinite(wider).all()
+    assert not np.allclose(default, wider)
+
+
+@pytest.mark.parametrize(
+    "method",
+    ["linear_scaling", "variance_scaling", "delta_method", "quantile_mapping", "quantile_delta_mapping"],
+)
+def test_adjust_spatial_chunks(datasets: dict, method: str) -> None:
+    """Each spatial dask chunk is adjusted at once and must match the in-memory result"""
+    obsh, simh, simp = (datasets["+"][name] for name in ("obsh", "simh", "simp"))
+    kwargs = {"kind": "+", "n_quantiles": 100}
+
+    expected = adjust(method=method, obs=obsh, simh=simh, simp=simp, **kwargs)
+    result = adjust(
+        method=method,
+        obs=obsh.chunk({"time": -1, "lat": 1}),
+        simh=simh.chunk({"time": -1, "lat": 1}),
+        simp=simp.chunk({"time": -1, "lat": 1}),
+        **kwargs,
+    )
+    assert np.allclose(result["+"].compute(), expected["+"], equal_nan=True)
@@ -18,6 +18,7 @@ import xarray as xr
 
 from cmethods import adjust
 from cmethods.distribution import (
+    _interp_uniform,
     detrended_quantile_mapping,
     quantile_delta_mapping,
     quantile_mapping,
@@ -87,6 +88,10 @@ def test_nan_or_equal() -> None:
     assert nan_or_equal(0, 0)
     assert nan_or_equal(np.nan, np.nan)
     assert not nan_or_equal(0, 1)
+    assert np.array_equal(
+        nan_or_equal(np.array((0, np.nan, 0, 1)), np.array((0, 1, np.nan, 2))),
+        np.array((True, True, True, False)),
+    )
 
 
 def test_get_pdf() -> None:
@@ -98,6 +103,27 @@ def test_get_adjusted_scaling_factor() -> None:
     assert get_adjusted_scaling_factor(10, 11) == 10
     assert get_adjusted_scaling_factor(-10, -11) == -10
     assert get_adjusted_scaling_factor(-11, -10) == -10
+    assert np.array_equal(
+        get_adjusted_scaling_factor(np.array((10, 4, -4, -11, np.nan)), 5),
+        np.array((5, 4, -4, -5, np.nan)),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.parametrize(("left", "right"), [(None, None), (0.0, None), (0.0, 2.0)])
+def test_interp_uniform(left: float, right: float) -> None:
+    """The shortcut for evenly spaced bins must match ``np.interp`` exactly"""
+    x = np.random.default_rng(0).normal(size=1000) * 3
+    x[::10] = np.nan
+    xbins = np.arange(-2.5, 2.5 + 0.3, 0.3)
+    x[:3] = xbins[[0, 5, -1]]
+    fp = np.linspace(0, 1, len(xbins))
+
+    assert np.array_equal(
+        _interp_uniform(x, xbins, fp, left=left, right=right),
+        np.interp(x, xbins, fp, left=left, right=right),
+        equal_nan=True,
+    )
 
 
 def test_ensure_devidable() -> None: